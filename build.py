@@ -10,53 +10,230 @@
   python build.py              # Web版ビルド
   python build.py --tauri      # Tauri版ビルド
   python build.py --check-only # 型チェックのみ
+  python build.py --no-cache   # 型チェックキャッシュを破棄して実行（変更なしでも型チェック）
 """
 
+import hashlib
+import json
+import os
 import subprocess
 import sys
 import argparse
+from functools import cache
 from pathlib import Path
 
 
+# 設定
+# なぜキャッシュ: tsc --incremental の結果を保存し、未変更ファイルの再チェックを省略するため
+TS_CACHE_DIR = Path(".cache") / "tsc"
+TS_BUILD_INFO_FILE = TS_CACHE_DIR / "app.tsbuildinfo"
+
+# なぜ記録: 前回の型チェック成功時からソースが変わっていなければ tsc 自体を省略するため
+TYPECHECK_STATE_FILE = Path(".cache") / "build" / "last-typecheck.json"
+TYPECHECK_SOURCE_ROOT = Path("src")
+TYPECHECK_SOURCE_SUFFIXES = (".ts", ".tsx")
+# src/ 以外で型チェック結果に影響するファイル（設定・依存関係）
+TYPECHECK_EXTRA_FILES = (Path("tsconfig.json"), Path("tsconfig.node.json"), Path("package-lock.json"))
+
+# なぜ常駐プロセス: npm / tsc をフェーズごとに起動せず、1つの Node.js で型チェックを処理するため
+CHECKER_SCRIPT = Path("scripts") / "checker.mjs"
+TYPESCRIPT_PACKAGE_DIR = Path("node_modules") / "typescript"
+
+
+@cache
 def get_npm_command():
     """
     OSに応じた npm コマンドを返す
     なぜ必要: Windowsでは npm.cmd、Unix系では npm を使用
+    なぜキャッシュ: 結果はプロセス中で変わらないため、初回の判定結果を再利用
     """
     if sys.platform == "win32":
         return "npm.cmd"
     return "npm"
 
 
+def print_step(description):
+    """処理ステップの見出しを表示"""
+    print(f"\n{'='*60}")
+    print(f"🔧 {description}")
+    print(f"{'='*60}\n")
+
+
 def run_command(command, description):
     """
     コマンドを実行して結果を表示
     なぜ関数化: DRY原則（同じコマンド実行処理を共通化）
+    なぜリスト形式: shell を経由せず直接起動し、余分なプロセス生成を避けるため
     """
-    print(f"\n{'='*60}")
-    print(f"🔧 {description}")
-    print(f"{'='*60}\n")
+    print_step(description)
 
     try:
-        result = subprocess.run(command, check=True, shell=True)
+        result = subprocess.run(command, check=True)
         print(f"\n✅ {description} 完了")
         return True
     except subprocess.CalledProcessError as error:
         print(f"\n❌ {description} 失敗: {error}")
         return False
+    except FileNotFoundError:
+        print(f"\n❌ {description} 失敗: {command[0]} が見つかりません")
+        return False
+
+
+def start_checker():
+    """
+    型チェック用の常駐 Node.js プロセス（scripts/checker.mjs）を起動
+    起動できない場合は None を返す（npm run type-check にフォールバック）
+    """
+    # typescript 未インストール時は起動せず、Node.js のエラー出力も出さない
+    if not CHECKER_SCRIPT.exists() or not TYPESCRIPT_PACKAGE_DIR.exists():
+        return None
+
+    try:
+        return subprocess.Popen(
+            ["node", str(CHECKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8"
+        )
+    except FileNotFoundError:
+        return None
+
+
+def request_checker(checker, command):
+    """
+    常駐プロセスにコマンドを1行のJSONで送り、結果を返す
+    プロセスが応答しない・不正な応答を返した場合は None を返す
+    """
+    try:
+        checker.stdin.write(json.dumps(command) + "\n")
+        checker.stdin.flush()
+        response = checker.stdout.readline()
+    except OSError:
+        return None
+
+    if not response:
+        return None
+
+    try:
+        return json.loads(response)
+    except ValueError:
+        return None
+
+
+def stop_checker(checker):
+    """常駐プロセスを終了"""
+    if checker is None:
+        return
+
+    try:
+        checker.stdin.write(json.dumps({"cmd": "exit"}) + "\n")
+        checker.stdin.close()
+        checker.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        checker.kill()
 
 
-def check_types():
-    """型チェックを実行"""
+def check_types(checker=None, use_cache=True):
+    """
+    型チェックを実行
+    なぜincremental: 前回の結果（tsbuildinfo）を再利用し、変更ファイルのみ再チェックするため
+    """
+    if not use_cache:
+        TS_BUILD_INFO_FILE.unlink(missing_ok=True)
+    TS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    description = "TypeScript型チェック"
+
+    if checker is not None:
+        result = request_checker(checker, {
+            "cmd": "typecheck",
+            "project": "tsconfig.json",
+            "tsBuildInfoFile": str(TS_BUILD_INFO_FILE.resolve()),
+            "pretty": sys.stdout.isatty()
+        })
+
+        if result is not None and "error" not in result:
+            print_step(description)
+            print(result["diagnostics"], end="")
+
+            if result["ok"]:
+                print(f"\n✅ {description} 完了")
+            else:
+                print(f"\n❌ {description} 失敗: {result['errorCount']} 件のエラー")
+            return result["ok"]
+
+        print("⚠️  型チェックサーバーが使えないため npm run type-check で実行します")
+
     npm_cmd = get_npm_command()
-    return run_command(f"{npm_cmd} run type-check", "TypeScript型チェック")
+    return run_command(
+        [npm_cmd, "run", "type-check", "--", "--incremental",
+         "--tsBuildInfoFile", TS_BUILD_INFO_FILE.as_posix()],
+        description
+    )
+
+
+def get_typecheck_fingerprint():
+    """
+    型チェック対象ファイルの (パス, mtime, サイズ) からハッシュ値を計算
+    なぜ内容ではなくmtime: 全ファイルを読まずに stat だけで変更を判定できるため
+    """
+    source_files = [
+        path for path in TYPECHECK_SOURCE_ROOT.rglob("*.ts*")
+        if path.suffix in TYPECHECK_SOURCE_SUFFIXES
+    ]
+    entries = []
+    for path in source_files + [path for path in TYPECHECK_EXTRA_FILES if path.exists()]:
+        stat = path.stat()
+        entries.append((path.as_posix(), stat.st_mtime_ns, stat.st_size))
+
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sorted(entries):
+        digest.update(repr(entry).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_last_typecheck_fingerprint():
+    """前回型チェックに成功した時のハッシュ値を読み込む（なければ None）"""
+    try:
+        state = json.loads(TYPECHECK_STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state.get("fingerprint") if isinstance(state, dict) else None
+
+
+def save_last_typecheck_fingerprint(fingerprint):
+    """型チェック成功時のハッシュ値を保存"""
+    TYPECHECK_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    TYPECHECK_STATE_FILE.write_text(
+        json.dumps({"fingerprint": fingerprint}),
+        encoding="utf-8"
+    )
+
+
+def get_directory_size(path):
+    """
+    ディレクトリ内の全ファイルの合計サイズ（バイト）を返す
+    なぜscandir: DirEntry が readdir 時のファイル種別を保持しており、種別判定の stat を省けるため
+    なぜスタック: 再帰呼び出しをせず、深い階層でも1つのループで走査するため
+    """
+    total_size = 0
+    pending_dirs = [path]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+    return total_size
 
 
 def build_web():
     """Web版をビルド"""
     npm_cmd = get_npm_command()
 
-    if not run_command(f"{npm_cmd} run build", "Web版ビルド"):
+    if not run_command([npm_cmd, "run", "build"], "Web版ビルド"):
         return False
 
     # ビルド結果の確認
@@ -65,7 +242,7 @@ def build_web():
         print(f"\n📦 ビルド成果物: {dist_path.absolute()}")
 
         # ファイルサイズを表示
-        total_size = sum(f.stat().st_size for f in dist_path.rglob('*') if f.is_file())
+        total_size = get_directory_size(dist_path)
         print(f"📊 合計サイズ: {total_size / 1024 / 1024:.2f} MB")
 
     return True
@@ -74,7 +251,7 @@ def build_web():
 def build_tauri():
     """Tauri版をビルド"""
     npm_cmd = get_npm_command()
-    return run_command(f"{npm_cmd} run tauri:build", "Tauri版ビルド")
+    return run_command([npm_cmd, "run", "tauri:build"], "Tauri版ビルド")
 
 
 def main():
@@ -101,13 +278,35 @@ def main():
         help="型チェックをスキップしてビルド"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="型チェックキャッシュ（tsbuildinfo）を削除し、変更がなくても型チェックを実行"
+    )
+
     args = parser.parse_args()
 
     print("🚀 ビルドプロセス開始")
 
     # 型チェック
     if not args.skip_check:
-        if not check_types():
+        # チェック中の変更を見逃さないよう、チェック前の状態を記録する
+        fingerprint = get_typecheck_fingerprint()
+
+        if not args.no_cache and fingerprint == load_last_typecheck_fingerprint():
+            print("\n✅ 型チェックスキップ (変更なし)")
+            types_ok = True
+        else:
+            checker = start_checker()
+            try:
+                types_ok = check_types(checker, use_cache=not args.no_cache)
+            finally:
+                stop_checker(checker)
+
+            if types_ok:
+                save_last_typecheck_fingerprint(fingerprint)
+
+        if not types_ok:
             print("\n❌ 型エラーがあります。修正してください。")
             print("💡 --skip-check オプションで型チェックをスキップできます")
             sys.exit(1)
@@ -5,195 +5,375 @@
 このファイルの役割:
 - 型チェック、コード品質チェックを一括実行
 - コミット前の確認を自動化
+- 各チェックは独立しているため並列実行
 
 使い方:
   python check.py           # 全チェック実行
   python check.py --quick   # 型チェックのみ（高速）
+  python check.py --no-cache # キャッシュ（型チェック・検索結果）を破棄して実行
 """
 
-import subprocess
+import asyncio
+import io
+import json
+import os
+import re
 import sys
 import argparse
+from functools import cache
 from pathlib import Path
 
 
+# 設定
+# なぜキャッシュ: tsc --incremental の結果を保存し、未変更ファイルの再チェックを省略するため
+TS_CACHE_DIR = Path(".cache") / "tsc"
+TS_BUILD_INFO_FILE = TS_CACHE_DIR / "app.tsbuildinfo"
+
+# ソース検索設定
+# なぜbytes: ファイルをデコードせずにそのまま検索するため（該当行のみ表示時にデコード）
+# なぜ \n を除外: ファイル全体を一括検索するため、行頭の数字が前の行の改行に一致しないようにする
+SCAN_ROOT = Path("src")
+SCAN_SUFFIXES = (".ts", ".tsx")
+MAGIC_NUMBER_PATTERN = re.compile(rb"[^a-zA-Z_\n][0-9]{2,}")
+CONSOLE_LOG_PATTERN = re.compile(rb"console\.log")
+TAILWIND_PATTERN = re.compile(rb'className=|class="')
+CONSOLE_LOG_EXCLUDED_FILES = ("errorHandler.ts",)
+
+# 検索結果キャッシュ
+# なぜキー: 検索条件が変わったら古い結果を使わないようにするため
+SCAN_CACHE_FILE = Path(".cache") / "check" / "scan.json"
+SCAN_CACHE_KEY = repr((
+    MAGIC_NUMBER_PATTERN.pattern,
+    CONSOLE_LOG_PATTERN.pattern,
+    TAILWIND_PATTERN.pattern,
+    CONSOLE_LOG_EXCLUDED_FILES,
+))
+
+
+@cache
 def get_npm_command():
     """
     OSに応じた npm コマンドを返す
     なぜ必要: Windowsでは npm.cmd、Unix系では npm を使用
+    なぜキャッシュ: 結果はプロセス中で変わらないため、初回の判定結果を再利用
     """
     if sys.platform == "win32":
         return "npm.cmd"
     return "npm"
 
 
-def print_section(title):
-    """セクションヘッダーを表示"""
-    print("\n" + "="*60)
-    print(f"🔍 {title}")
-    print("="*60 + "\n")
+def print_section(title, out):
+    """セクションヘッダーを出力バッファに書き込む"""
+    print("\n" + "="*60, file=out)
+    print(f"🔍 {title}", file=out)
+    print("="*60 + "\n", file=out)
+
+
+async def run_process(*command):
+    """
+    コマンドを非同期実行して (終了コード, 出力) を返す
+    なぜ出力を捕捉: 並列実行中に各チェックの出力が混ざらないようにするため
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode, stdout.decode("utf-8", errors="replace")
+
 
+async def run_type_check(use_cache=True):
+    """
+    TypeScript型チェック
+    なぜincremental: 前回の結果（tsbuildinfo）を再利用し、変更ファイルのみ再チェックするため
+    """
+    out = io.StringIO()
+    print_section("TypeScript型チェック", out)
 
-def run_type_check():
-    """TypeScript型チェック"""
-    print_section("TypeScript型チェック")
+    if not use_cache:
+        TS_BUILD_INFO_FILE.unlink(missing_ok=True)
+    TS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     npm_cmd = get_npm_command()
 
     try:
-        subprocess.run([npm_cmd, "run", "type-check"], check=True, shell=True)
-        print("✅ 型エラーなし")
-        return True
-    except subprocess.CalledProcessError:
-        print("❌ 型エラーがあります")
-        return False
+        returncode, output = await run_process(
+            npm_cmd, "run", "type-check", "--", "--incremental",
+            "--tsBuildInfoFile", TS_BUILD_INFO_FILE.as_posix()
+        )
+        print(output, file=out)
 
+        if returncode == 0:
+            print("✅ 型エラーなし", file=out)
+            return True, out.getvalue()
+        else:
+            print("❌ 型エラーがあります", file=out)
+            return False, out.getvalue()
+    except FileNotFoundError:
+        print(f"❌ {npm_cmd} が見つかりません", file=out)
+        return False, out.getvalue()
 
-def run_eslint_check():
+
+async def run_eslint_check():
     """ESLintチェック"""
-    print_section("ESLintチェック")
-    
+    out = io.StringIO()
+    print_section("ESLintチェック", out)
+
     npm_cmd = get_npm_command()
-    
+
     try:
-        result = subprocess.run(
-            [npm_cmd, "run", "lint"], 
-            check=False, 
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            print("✅ ESLintエラーなし")
-            return True
+        returncode, output = await run_process(npm_cmd, "run", "lint")
+
+        if returncode == 0:
+            print("✅ ESLintエラーなし", file=out)
+            return True, out.getvalue()
         else:
-            print("❌ ESLintエラーがあります")
-            print(result.stdout)
-            return False
+            print("❌ ESLintエラーがあります", file=out)
+            print(output, file=out)
+            return False, out.getvalue()
     except Exception as error:
-        print(f"⚠️  ESLint実行エラー: {error}")
-        return True  # エラーでも継続
+        print(f"⚠️  ESLint実行エラー: {error}", file=out)
+        return True, out.getvalue()  # エラーでも継続
 
 
-def run_prettier_check():
+async def run_prettier_check():
     """Prettierフォーマットチェック"""
-    print_section("Prettierフォーマットチェック")
-    
+    out = io.StringIO()
+    print_section("Prettierフォーマットチェック", out)
+
     npm_cmd = get_npm_command()
-    
+
     try:
-        result = subprocess.run(
-            [npm_cmd, "run", "format:check"], 
-            check=False, 
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            print("✅ フォーマットOK")
-            return True
+        returncode, output = await run_process(npm_cmd, "run", "format:check")
+
+        if returncode == 0:
+            print("✅ フォーマットOK", file=out)
+            return True, out.getvalue()
         else:
-            print("⚠️  フォーマットが必要なファイルがあります")
-            print(result.stdout)
-            print("\n💡 自動修正: npm run format")
-            return False
+            print("⚠️  フォーマットが必要なファイルがあります", file=out)
+            print(output, file=out)
+            print("\n💡 自動修正: npm run format", file=out)
+            return False, out.getvalue()
     except Exception as error:
-        print(f"⚠️  Prettier実行エラー: {error}")
-        return True  # エラーでも継続
+        print(f"⚠️  Prettier実行エラー: {error}", file=out)
+        return True, out.getvalue()  # エラーでも継続
 
 
-def run_code_quality_check():
+async def run_code_quality_check():
     """コード品質チェック（scripts/check-code-quality.sh）"""
-    print_section("コード品質チェック")
+    out = io.StringIO()
+    print_section("コード品質チェック", out)
 
-    script_path = Path("scripts") / "check-code-quality.sh"
+    script_path = os.path.join("scripts", "check-code-quality.sh")
 
-    if not script_path.exists():
-        print("⚠️  check-code-quality.sh が見つかりません（スキップ）")
-        return True
+    if not os.path.exists(script_path):
+        print("⚠️  check-code-quality.sh が見つかりません（スキップ）", file=out)
+        return True, out.getvalue()
 
     try:
         # Windows環境の場合はbashで実行
         if sys.platform == "win32":
-            subprocess.run(["bash", str(script_path)], check=False, shell=False)
+            _, output = await run_process("bash", script_path)
         else:
-            subprocess.run([str(script_path)], check=False, shell=False)
+            _, output = await run_process(script_path)
+        print(output, file=out)
 
-        print("✅ コード品質チェック完了")
-        return True
+        print("✅ コード品質チェック完了", file=out)
+        return True, out.getvalue()
     except Exception as error:
-        print(f"⚠️  コード品質チェック実行エラー: {error}")
-        return True  # エラーでも継続
+        print(f"⚠️  コード品質チェック実行エラー: {error}", file=out)
+        return True, out.getvalue()  # エラーでも継続
 
 
-def search_magic_numbers():
-    """マジックナンバーを検索"""
-    print_section("マジックナンバー検索")
+def find_matching_lines(pattern, data):
+    """
+    ファイル全体に対して pattern を検索し、一致した行を (行番号, 行内容) で順に返す
+    なぜ行分割しない: 一致しない大半の行を切り出さず、正規表現エンジンに一括で走査させるため
+    ※ 1行に複数一致しても1回だけ返す（grep と同じ行単位）
+    """
+    line_number = 1
+    counted_until = 0
+    next_line_start = 0
 
-    try:
-        result = subprocess.run(
-            ["grep", "-rn", "--include=*.ts", "--include=*.tsx",
-             "-E", r"[^a-zA-Z_][0-9]{2,}", "src/"],
-            capture_output=True,
-            text=True
-        )
+    for match in pattern.finditer(data):
+        if match.start() < next_line_start:
+            continue
 
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            # TailwindCSSクラスを除外
-            filtered = [line for line in lines if 'className=' not in line and 'class="' not in line]
-
-            if filtered:
-                print(f"⚠️  マジックナンバーが {len(filtered)} 件見つかりました:")
-                for line in filtered[:10]:  # 最初の10件のみ表示
-                    print(f"   {line}")
-                if len(filtered) > 10:
-                    print(f"   ... 他 {len(filtered) - 10} 件")
-            else:
-                print("✅ マジックナンバーなし（TailwindCSSクラスを除く）")
-        else:
-            print("✅ マジックナンバーなし")
+        line_start = data.rfind(b"\n", 0, match.start()) + 1
+        line_end = data.find(b"\n", match.end())
+        if line_end == -1:
+            line_end = len(data)
 
-        return True
-    except FileNotFoundError:
-        print("⚠️  grep コマンドが見つかりません（スキップ）")
-        return True
+        line_number += data.count(b"\n", counted_until, line_start)
+        counted_until = line_start
+        next_line_start = line_end + 1
+
+        yield line_number, data[line_start:line_end]
+
+
+def scan_file(path):
+    """
+    1ファイルを検索し、(マジックナンバーの該当行, console.log の該当行) を返す
+    形式: grep -n と同じ "パス:行番号:内容"
+    """
+    data = path.read_bytes()
+    file_name = path.as_posix()
+
+    def format_hit(line_number, line):
+        text = line.rstrip(b"\r").decode("utf-8", errors="replace")
+        return f"{file_name}:{line_number}:{text}"
+
+    # TailwindCSSクラスを除外
+    magic_hits = [
+        format_hit(line_number, line)
+        for line_number, line in find_matching_lines(MAGIC_NUMBER_PATTERN, data)
+        if not TAILWIND_PATTERN.search(line)
+    ]
+
+    # errorHandler.tsのlogDebug実装を除外
+    log_hits = []
+    if path.name not in CONSOLE_LOG_EXCLUDED_FILES:
+        log_hits = [
+            format_hit(line_number, line)
+            for line_number, line in find_matching_lines(CONSOLE_LOG_PATTERN, data)
+        ]
+
+    return magic_hits, log_hits
+
+
+def load_scan_cache():
+    """
+    前回の検索結果を読み込む
+    なぜキー比較: 検索パターンが変わった場合はキャッシュ全体を無効化するため
+    """
+    try:
+        cache = json.loads(SCAN_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
+    if not isinstance(cache, dict) or cache.get("key") != SCAN_CACHE_KEY:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
 
-def search_console_log():
-    """console.log を検索"""
-    print_section("console.log検索（本番前に削除）")
 
+def save_scan_cache(files):
+    """検索結果を保存（失敗しても検索結果には影響しないため無視）"""
     try:
-        result = subprocess.run(
-            ["grep", "-rn", "--include=*.ts", "--include=*.tsx",
-             "console.log", "src/"],
-            capture_output=True,
-            text=True
+        SCAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        SCAN_CACHE_FILE.write_text(
+            json.dumps({"key": SCAN_CACHE_KEY, "files": files}),
+            encoding="utf-8"
         )
+    except OSError:
+        pass
+
 
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            # errorHandler.tsのlogDebug実装を除外
-            filtered = [line for line in lines if 'errorHandler.ts' not in line]
-
-            if filtered:
-                print(f"⚠️  console.log が {len(filtered)} 件見つかりました:")
-                for line in filtered[:10]:
-                    print(f"   {line}")
-                if len(filtered) > 10:
-                    print(f"   ... 他 {len(filtered) - 10} 件")
-            else:
-                print("✅ console.log なし（errorHandler除く）")
+def scan_src(use_cache=True):
+    """
+    src/ 配下の .ts/.tsx を1回だけ走査し、マジックナンバーと console.log を検索
+    なぜ1回の走査: grep を2回起動する代わりに、同じファイル読み込みを両方の検索で共有するため
+    なぜキャッシュ: (mtime, サイズ) が前回と同じファイルは再検索せず、前回の結果を再利用するため
+    戻り値: (マジックナンバーの該当行, console.log の該当行)
+    """
+    cached_files = load_scan_cache() if use_cache else {}
+    results = {}
+    stale_paths = []
+
+    for path in sorted(SCAN_ROOT.rglob("*.ts*")):
+        if path.suffix not in SCAN_SUFFIXES or not path.is_file():
+            continue
+
+        stat = path.stat()
+        cache_key = path.as_posix()
+        entry = cached_files.get(cache_key)
+
+        # 手編集や書き込み途中の scan.json でも落ちないよう、形式を確認してから比較
+        is_valid_entry = isinstance(entry, list) and len(entry) == 4
+        if is_valid_entry and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            results[cache_key] = entry
         else:
-            print("✅ console.log なし")
+            results[cache_key] = [stat.st_mtime_ns, stat.st_size, [], []]
+            stale_paths.append(path)
 
-        return True
-    except FileNotFoundError:
-        print("⚠️  grep コマンドが見つかりません（スキップ）")
-        return True
+    # なぜ直列: プロセスプールの起動コストが、このリポジトリ規模の検索時間を上回るため
+    for path in stale_paths:
+        results[path.as_posix()][2:] = list(scan_file(path))
+
+    magic_hits = [hit for entry in results.values() for hit in entry[2]]
+    log_hits = [hit for entry in results.values() for hit in entry[3]]
+
+    # 削除されたファイルは保存対象から外れる（--no-cache 時はキャッシュに触れない）
+    if use_cache:
+        save_scan_cache(results)
+    return magic_hits, log_hits
+
+
+async def search_magic_numbers(source_scan):
+    """マジックナンバーを検索（scan_src の結果を使用）"""
+    out = io.StringIO()
+    print_section("マジックナンバー検索", out)
+
+    filtered, _ = await source_scan
+
+    if filtered:
+        print(f"⚠️  マジックナンバーが {len(filtered)} 件見つかりました:", file=out)
+        for line in filtered[:10]:  # 最初の10件のみ表示
+            print(f"   {line}", file=out)
+        if len(filtered) > 10:
+            print(f"   ... 他 {len(filtered) - 10} 件", file=out)
+    else:
+        print("✅ マジックナンバーなし（TailwindCSSクラスを除く）", file=out)
+
+    return True, out.getvalue()
+
+
+async def search_console_log(source_scan):
+    """console.log を検索（scan_src の結果を使用）"""
+    out = io.StringIO()
+    print_section("console.log検索（本番前に削除）", out)
+
+    _, filtered = await source_scan
+
+    if filtered:
+        print(f"⚠️  console.log が {len(filtered)} 件見つかりました:", file=out)
+        for line in filtered[:10]:
+            print(f"   {line}", file=out)
+        if len(filtered) > 10:
+            print(f"   ... 他 {len(filtered) - 10} 件", file=out)
+    else:
+        print("✅ console.log なし（errorHandler除く）", file=out)
+
+    return True, out.getvalue()
+
+
+async def run_checks(args):
+    """
+    各チェックを並列実行し、(名前, 結果) のリストを返す
+    なぜ並列: チェック同士は独立しており、所要時間を合計から最大値に短縮できるため
+    """
+    checks = [("TypeScript型チェック", run_type_check(use_cache=not args.no_cache))]
+
+    # クイックモードでない場合は追加チェック
+    if not args.quick:
+        checks.append(("ESLint", run_eslint_check()))
+        checks.append(("Prettier", run_prettier_check()))
+        checks.append(("コード品質", run_code_quality_check()))
+
+        # src/ の走査は1回だけ行い、2つの検索で結果を共有
+        source_scan = asyncio.create_task(asyncio.to_thread(scan_src, use_cache=not args.no_cache))
+        checks.append(("マジックナンバー", search_magic_numbers(source_scan)))
+        checks.append(("console.log", search_console_log(source_scan)))
+
+    outcomes = await asyncio.gather(*(check for _, check in checks))
+
+    results = []
+    for (name, _), (passed, output) in zip(checks, outcomes):
+        # 完了後にまとめて表示（出力が混ざらないように）
+        print(output, end="")
+        results.append((name, passed))
+    return results
 
 
 def main():
@@ -208,22 +388,17 @@ def main():
         help="型チェックのみ実行（高速）"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="キャッシュ（tsbuildinfo・検索結果）を使わずに実行"
+    )
+
     args = parser.parse_args()
 
     print("🚀 コード品質チェック開始\n")
 
-    results = []
-
-    # 型チェック（必須）
-    results.append(("TypeScript型チェック", run_type_check()))
-
-    # クイックモードでない場合は追加チェック
-    if not args.quick:
-        results.append(("ESLint", run_eslint_check()))
-        results.append(("Prettier", run_prettier_check()))
-        results.append(("コード品質", run_code_quality_check()))
-        results.append(("マジックナンバー", search_magic_numbers()))
-        results.append(("console.log", search_console_log()))
+    results = asyncio.run(run_checks(args))
 
     # 結果サマリー
     print("\n" + "="*60)
@@ -13,36 +13,44 @@
   python dev.py --help    # ヘルプ表示
 """
 
+import os
+import socket
 import subprocess
 import sys
 import time
-import webbrowser
-import argparse
-from pathlib import Path
+from functools import cache
+from types import SimpleNamespace
+from urllib.parse import urlparse
 
 
 # 設定
 DEV_SERVER_URL = "http://localhost:1420"
-WAIT_TIME_SECONDS = 3  # サーバー起動待機時間
+SERVER_START_TIMEOUT_SECONDS = 15  # サーバー起動待機の上限時間
+PORT_POLL_INTERVAL_SECONDS = 0.05  # ポート確認の間隔
+PORT_CONNECT_TIMEOUT_SECONDS = 0.1  # 1回の接続試行のタイムアウト
 
 
+@cache
 def get_npm_command():
     """
     OSに応じた npm コマンドを返す
     なぜ必要: Windowsでは npm.cmd、Unix系では npm を使用
+    なぜキャッシュ: 結果はプロセス中で変わらないため、初回の判定結果を再利用
     """
     if sys.platform == "win32":
         return "npm.cmd"
     return "npm"
 
 
+@cache
 def check_node_modules():
     """
     node_modules が存在するか確認
     なぜ必要: npm install が実行されていない場合にエラーを防ぐ
+    なぜキャッシュ: 1プロセス中に何度呼ばれても stat は1回で済ませるため
     """
-    node_modules = Path("node_modules")
-    if not node_modules.exists():
+    # なぜ os.path: 起動直後の単純な存在確認のため、pathlib を読み込まずに済ませる
+    if not os.path.exists("node_modules"):
         print("❌ node_modules が見つかりません")
         print("📦 npm install を実行してください:")
         print("   npm install")
@@ -50,6 +58,24 @@ def check_node_modules():
     return True
 
 
+def wait_for_port(host, port, timeout, process=None):
+    """
+    指定ポートに接続できるまで待機
+    なぜ固定時間の待機ではない: 起動が速ければすぐに進み、遅くても接続可能になるまで待てるため
+    戻り値: 接続できた場合 True（タイムアウト、またはプロセスが終了した場合 False）
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            socket.create_connection((host, port), timeout=PORT_CONNECT_TIMEOUT_SECONDS).close()
+            return True
+        except OSError:
+            time.sleep(PORT_POLL_INTERVAL_SECONDS)
+    return False
+
+
 def start_web_dev():
     """
     Web版開発サーバーを起動
@@ -59,40 +85,44 @@ def start_web_dev():
     print(f"📍 URL: {DEV_SERVER_URL}")
     print()
 
+    # なぜここでimport: ブラウザ起動用のモジュールは Web版でしか使わないため
+    import webbrowser
+
     npm_cmd = get_npm_command()
 
     try:
         # npm run dev をバックグラウンドで起動
-        process = subprocess.Popen(
-            [npm_cmd, "run", "dev"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            shell=True  # Windows互換性のため
-        )
-
-        # サーバー起動を待機
-        print(f"⏳ サーバー起動中... ({WAIT_TIME_SECONDS}秒待機)")
-        time.sleep(WAIT_TIME_SECONDS)
-
-        # ブラウザを開く
-        print(f"🌐 ブラウザを開きます: {DEV_SERVER_URL}")
-        webbrowser.open(DEV_SERVER_URL)
+        # なぜ標準出力を継承: サーバーの出力を Python で中継せず、直接端末に書き込ませるため
+        sys.stdout.flush()
+        process = subprocess.Popen([npm_cmd, "run", "dev"])
 
-        print()
-        print("✅ 開発サーバー起動完了！")
-        print()
-        print("📝 操作方法:")
-        print("   - ブラウザでゲームが表示されます")
-        print("   - コード変更時に自動リロード（HMR）")
-        print("   - Ctrl+C で終了")
-        print()
-
-        # サーバーの出力を表示
         try:
-            for line in process.stdout:
-                print(line, end='')
+            # サーバー起動を待機（ポートに接続できるまで）
+            server_url = urlparse(DEV_SERVER_URL)
+            print(f"⏳ サーバー起動中... (最大{SERVER_START_TIMEOUT_SECONDS}秒待機)")
+            if not wait_for_port(server_url.hostname, server_url.port,
+                                 SERVER_START_TIMEOUT_SECONDS, process):
+                if process.poll() is not None:
+                    print(f"❌ 開発サーバーが終了しました（終了コード: {process.returncode}）")
+                    sys.exit(1)
+                print("⚠️  サーバーの起動を確認できませんでした")
+
+            # ブラウザを開く
+            print(f"🌐 ブラウザを開きます: {DEV_SERVER_URL}")
+            webbrowser.open(DEV_SERVER_URL)
+
+            print()
+            print("✅ 開発サーバー起動完了！")
+            print()
+            print("📝 操作方法:")
+            print("   - ブラウザでゲームが表示されます")
+            print("   - コード変更時に自動リロード（HMR）")
+            print("   - Ctrl+C で終了")
+            print()
+            sys.stdout.flush()
+
+            # サーバーの終了を待機
+            process.wait()
         except KeyboardInterrupt:
             print("\n⏹️  サーバーを停止中...")
             process.terminate()
@@ -118,8 +148,13 @@ def start_tauri_dev():
     npm_cmd = get_npm_command()
 
     try:
-        # npm run tauri:dev を実行
-        subprocess.run([npm_cmd, "run", "tauri:dev"], check=True, shell=True)
+        if sys.platform == "win32":
+            # Windowsの execvp は新プロセスを起動して終了するだけで Ctrl+C が届かなくなるため通常実行
+            subprocess.run([npm_cmd, "run", "tauri:dev"], check=True)
+        else:
+            # 後処理がないため Python プロセスを npm に置き換える（シグナルも直接 npm に届く）
+            sys.stdout.flush()
+            os.execvp(npm_cmd, [npm_cmd, "run", "tauri:dev"])
 
     except FileNotFoundError:
         print("❌ npm が見つかりません")
@@ -137,11 +172,18 @@ def start_tauri_dev():
         sys.exit(1)
 
 
-def main():
+def parse_args():
     """
-    メイン処理
-    コマンドライン引数を解析して適切な起動モードを選択
+    コマンドライン引数を解析
+    なぜ高速パス: 引数なし / --tauri のみの通常起動では argparse を読み込まずに済ませるため
+    （--help や不明な引数は argparse で処理）
     """
+    argv = sys.argv[1:]
+    if set(argv) <= {"--tauri"}:
+        return SimpleNamespace(tauri="--tauri" in argv)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="開発サーバー起動スクリプト",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -159,7 +201,15 @@ def main():
         help="Tauri版（デスクトップアプリ）を起動"
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    """
+    メイン処理
+    コマンドライン引数を解析して適切な起動モードを選択
+    """
+    args = parse_args()
 
     # node_modules チェック
     if not check_node_modules():
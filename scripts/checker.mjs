@@ -0,0 +1,111 @@
+import { createInterface } from "readline";
+import { dirname, join } from "path";
+import { fileURLToPath } from "url";
+import ts from "typescript";
+
+// このファイルの役割: TypeScript型チェックを常駐プロセスとして提供する
+// なぜ常駐: npm / tsc をフェーズごとに起動すると、その都度 Node.js の起動コストがかかるため
+// プロトコル: 標準入力から1行1コマンドのJSONを受け取り、標準出力に1行1結果のJSONを返す
+//   {"cmd": "typecheck", "project": "tsconfig.json", "tsBuildInfoFile": "...", "pretty": true}
+//   {"cmd": "exit"}
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const projectRoot = join(__dirname, "..");
+
+// プロジェクトごとの前回の Program（同一プロセス内での再チェックを差分のみにする）
+const previousPrograms = new Map();
+
+const formatHost = {
+  getCanonicalFileName: (fileName) => fileName,
+  getCurrentDirectory: () => projectRoot,
+  getNewLine: () => ts.sys.newLine,
+};
+
+const formatDiagnostics = (diagnostics, pretty) =>
+  pretty
+    ? ts.formatDiagnosticsWithColorAndContext(diagnostics, formatHost)
+    : ts.formatDiagnostics(diagnostics, formatHost);
+
+const typecheck = ({ project = "tsconfig.json", tsBuildInfoFile, pretty = false }) => {
+  const configPath = join(projectRoot, project);
+  const configFile = ts.readConfigFile(configPath, ts.sys.readFile);
+  if (configFile.error) {
+    return {
+      ok: false,
+      errorCount: 1,
+      diagnostics: formatDiagnostics([configFile.error], pretty),
+    };
+  }
+
+  const parsedConfig = ts.parseJsonConfigFileContent(
+    configFile.config,
+    ts.sys,
+    dirname(configPath),
+    { incremental: true, noEmit: true, tsBuildInfoFile },
+    configPath
+  );
+  const host = ts.createIncrementalCompilerHost(parsedConfig.options);
+
+  // 初回は tsbuildinfo から、2回目以降はメモリ上の Program から差分チェック
+  const oldProgram =
+    previousPrograms.get(configPath) ?? ts.readBuilderProgram(parsedConfig.options, host);
+
+  const program = ts.createEmitAndSemanticDiagnosticsBuilderProgram(
+    parsedConfig.fileNames,
+    parsedConfig.options,
+    host,
+    oldProgram,
+    ts.getConfigFileParsingDiagnostics(parsedConfig),
+    parsedConfig.projectReferences
+  );
+  previousPrograms.set(configPath, program);
+
+  // getPreEmitDiagnostics は tsconfig の解析エラーも含む（tsc --noEmit と同じ内容）
+  const diagnostics = [
+    ...ts.getPreEmitDiagnostics(program),
+    // noEmit のため出力されるのは tsbuildinfo のみ
+    ...program.emit().diagnostics,
+  ];
+  const errorCount = diagnostics.filter(
+    (diagnostic) => diagnostic.category === ts.DiagnosticCategory.Error
+  ).length;
+
+  return {
+    ok: errorCount === 0,
+    errorCount,
+    diagnostics: formatDiagnostics(diagnostics, pretty),
+  };
+};
+
+const handlers = { typecheck };
+
+const respond = (result) => {
+  process.stdout.write(`${JSON.stringify(result)}\n`);
+};
+
+const lines = createInterface({ input: process.stdin });
+
+lines.on("line", (line) => {
+  if (!line.trim()) {
+    return;
+  }
+
+  try {
+    const command = JSON.parse(line);
+    if (command.cmd === "exit") {
+      lines.close();
+      return;
+    }
+
+    const handler = handlers[command.cmd];
+    if (!handler) {
+      respond({ ok: false, error: `Unknown command: ${command.cmd}` });
+      return;
+    }
+    respond(handler(command));
+  } catch (error) {
+    respond({ ok: false, error: error instanceof Error ? error.message : String(error) });
+  }
+});